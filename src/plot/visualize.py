@@ -1,110 +1,371 @@
 import argparse
+import atexit
+import functools
+import os
+import tempfile
+import warnings
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
+import matplotlib
+
+# Non-interactive backend: we only write PNGs, so skip GUI backend probing
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
+try:
+    from bottleneck import nanmax, nanmean, nanmin
+except ImportError:  # optional: bottleneck's C loops are faster, NumPy gives the same results
+    from numpy import nanmax, nanmean, nanmin
+
+try:
+    import numba
+except ImportError:  # optional: fall back to the NumPy implementation
+    numba = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: fall back to pandas' C parser
+    pa = pacsv = None
+
+
+@dataclass
+class MethodData:
+    """Cleaned numeric contents of one CSV: NoOfEvals plus one column per trial."""
+
+    evals: np.ndarray  # NoOfEvals, sorted and unique, shape (n_rows,)
+    trials: np.ndarray  # trial values with NaN for missing cells, shape (n_rows, n_trials)
+    trial_names: List[str]
+    # Computed once at load time and shared by limits and plotting
+    mean_y: np.ndarray  # per-row mean across trials, NaN where no trial is valid, shape (n_rows,)
+    first_valid: np.ndarray  # first valid row index per trial, shape (n_trials,)
+    last_valid: np.ndarray  # last valid row index per trial, shape (n_trials,)
+    valid_counts: np.ndarray  # number of valid rows per trial, shape (n_trials,)
+
+
+def nanmean_rows(trials: np.ndarray) -> np.ndarray:
+    """Row-wise mean ignoring NaNs; rows without any valid trial give NaN."""
+    with warnings.catch_warnings():
+        # All-NaN rows are expected (trials of different lengths) and simply stay NaN
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return nanmean(trials, axis=1)
+
+
+def _trial_stats_numpy(trials: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    valid = ~np.isnan(trials)
+    counts = valid.sum(axis=0)
+    if len(trials) == 0:
+        # argmax is undefined on zero rows; no trial has a valid range anyway
+        return np.empty(0), counts, counts, counts
+    first = np.argmax(valid, axis=0)
+    last = len(trials) - 1 - np.argmax(valid[::-1], axis=0)
+    return nanmean_rows(trials), first, last, counts
+
+
+if numba is not None:
+
+    # fastmath is left off because it lets the compiler assume no NaNs, which breaks the isnan checks
+    @numba.njit(parallel=True, cache=True)
+    def _trial_stats_numba(trials):
+        n, k = trials.shape
+        mean_y = np.empty(n)
+        for i in numba.prange(n):
+            total = 0.0
+            c = 0
+            for j in range(k):
+                v = trials[i, j]
+                if not np.isnan(v):
+                    total += v
+                    c += 1
+            mean_y[i] = total / c if c > 0 else np.nan
+        first = np.zeros(k, dtype=np.int64)
+        last = np.zeros(k, dtype=np.int64)
+        counts = np.zeros(k, dtype=np.int64)
+        for j in numba.prange(k):
+            for i in range(n):
+                if not np.isnan(trials[i, j]):
+                    if counts[j] == 0:
+                        first[j] = i
+                    last[j] = i
+                    counts[j] += 1
+        return mean_y, first, last, counts
+
+
+# Below this many cells the NumPy path takes well under a millisecond, far less than numba's JIT compile
+NUMBA_MIN_SIZE = 1_000_000
+
+
+def trial_stats(trials: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    One pass over a (n_rows, n_trials) matrix returning (mean_y, first, last, counts):
+    the NaN-skipping row mean, and per trial the first/last valid row index and number of valid rows.
+    Uses a parallel numba kernel when numba is installed and the matrix has at least NUMBA_MIN_SIZE cells;
+    smaller matrices always take the NumPy path.
+    """
+    if numba is not None and trials.size >= NUMBA_MIN_SIZE:
+        return _trial_stats_numba(trials)
+    return _trial_stats_numpy(trials)
+
+
+def read_csv_clean(path: Path) -> MethodData:
+    """Parse and clean a CSV; the same file (path and mtime) is parsed at most once per process."""
+    st = path.stat()
+    return _read_csv_clean_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def _read_csv_pyarrow(path: Path) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Multi-threaded parse with pyarrow, converting every column to a float64 ndarray.
+    Returns None when pyarrow is unavailable or a column is not numeric, so the caller can fall back.
+    """
+    if pacsv is None:
+        return None
+    try:
+        tbl = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(null_values=["", "NA", "nan"], strings_can_be_null=True),
+        )
+    except pa.ArrowInvalid:
+        return None
+    # Repeated header names: pandas renames them (a, a.1), so let it handle the file
+    if len(set(tbl.column_names)) != len(tbl.column_names):
+        return None
+    numeric = (pa.types.is_floating, pa.types.is_integer, pa.types.is_null)
+    if not all(any(check(field.type) for check in numeric) for field in tbl.schema):
+        return None
+    # Nulls become NaN in the float64 conversion
+    return {name: tbl.column(name).cast(pa.float64()).to_numpy(zero_copy_only=False) for name in tbl.column_names}
+
+
+def _read_csv_pandas(path: Path) -> Dict[str, np.ndarray]:
+    try:
+        # All columns are expected to be numeric, so skip per-column dtype inference
+        df = pd.read_csv(path, dtype=np.float64, engine="c", na_values=["", "NA", "nan"], low_memory=False)
+        return {c: df[c].to_numpy() for c in df.columns}
+    except ValueError:
+        # Non-numeric cells present: let pandas infer and coerce them to NaN
+        df = pd.read_csv(path)
+        return {c: pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float64) for c in df.columns}
+
+
+def _load_clean_npz(cache: Path, src_mtime_ns: int, src_size: int) -> Optional[Tuple[MethodData, int]]:
+    """
+    Load (data, n_dropped) saved by _save_clean_npz.
+    Returns None if the file is unreadable, has a different layout, or was built from a source CSV
+    with a different mtime or size.
+    """
+    try:
+        with np.load(cache) as npz:
+            # Exact match: copies made with cp -p / rsync -a / tar keep an old mtime, so ">=" is not enough
+            if int(npz["src_mtime_ns"]) != src_mtime_ns or int(npz["src_size"]) != src_size:
+                return None
+            md = MethodData(
+                evals=npz["evals"],
+                trials=npz["trials"],
+                trial_names=[str(name) for name in npz["trial_names"]],
+                mean_y=npz["mean_y"],
+                first_valid=npz["first_valid"],
+                last_valid=npz["last_valid"],
+                valid_counts=npz["valid_counts"],
+            )
+            return md, int(npz["n_dropped"])
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+        return None
+
+
+def _save_clean_npz(cache: Path, src_mtime_ns: int, src_size: int, md: MethodData, n_dropped: int) -> None:
+    # Write to a unique temporary file first so a concurrent run never sees a partial cache
+    tmp = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=cache.parent, prefix=cache.name + ".", suffix=".tmp", delete=False) as f:
+            tmp = f.name
+            np.savez(
+                f,
+                evals=md.evals,
+                trials=md.trials,
+                trial_names=np.array(md.trial_names, dtype=str),
+                mean_y=md.mean_y,
+                first_valid=md.first_valid,
+                last_valid=md.last_valid,
+                valid_counts=md.valid_counts,
+                n_dropped=n_dropped,
+                src_mtime_ns=src_mtime_ns,
+                src_size=src_size,
+            )
+        os.replace(tmp, cache)
+    except OSError as e:
+        print(f"[WARN] Could not write cache {cache}: {e}")
+        if tmp is not None and os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_csv_clean_cached(resolved_path: str, mtime_ns: int, size: int) -> MethodData:
+    # mtime_ns and size are part of the cache key, so an edited file is parsed again
+    path = Path(resolved_path)
+    # Cleaned arrays are persisted next to the CSV and reused while the CSV's mtime and size are unchanged
+    cache = path.with_name(path.name + ".clean.npz")
+    loaded = None
+    if cache.exists():
+        loaded = _load_clean_npz(cache, mtime_ns, size)
+    if loaded is None:
+        loaded = _parse_and_clean(path)
+        _save_clean_npz(cache, mtime_ns, size, *loaded)
+    md, n_dropped = loaded
+    # Printed from the cleaned arrays so cached and fresh loads report the same thing
+    _print_diagnostics(path, md.evals, n_dropped)
+    # The result may be shared by several labels, so guard against accidental mutation
+    for arr in (md.evals, md.trials, md.mean_y, md.first_valid, md.last_valid, md.valid_counts):
+        arr.flags.writeable = False
+    return md
+
+
+def _format_evals(value: float) -> str:
+    # NoOfEvals is read as float64 but is normally an integer count; print it as one
+    return str(int(value)) if float(value).is_integer() else str(value)
+
 
-def read_csv_clean(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
-    if "NoOfEvals" not in df.columns:
-        raise ValueError(f"{path} must include a 'NoOfEvals' column. Found columns: {list(df.columns)}")
-    # Coerce to numeric and drop NaNs
-    df["NoOfEvals"] = pd.to_numeric(df["NoOfEvals"], errors="coerce")
-    before = len(df)
-    df = df.dropna(subset=["NoOfEvals"]).copy()
-    if len(df) < before:
-        print(f"[WARN] Dropped {before - len(df)} rows with non-numeric NoOfEvals in {path.name}")
-    # Sort and deduplicate
-    df = df.sort_values("NoOfEvals").drop_duplicates(subset=["NoOfEvals"], keep="last").reset_index(drop=True)
-
-    # Diagnostics
-    if len(df) == 0:
+def _print_diagnostics(path: Path, evals: np.ndarray, n_dropped: int) -> None:
+    if n_dropped:
+        print(f"[WARN] Dropped {n_dropped} rows with non-numeric NoOfEvals in {path.name}")
+    if len(evals) == 0:
         print(f"[WARN] {path.name}: empty after cleaning.")
     else:
-        n_unique = df["NoOfEvals"].nunique()
-        min_x = df["NoOfEvals"].min()
-        max_x = df["NoOfEvals"].max()
-        all_zero = bool((df["NoOfEvals"] == 0).all())
-        print(f"[INFO] {path.name}: rows={len(df)} unique_x={n_unique} range=[{min_x}, {max_x}] all_zero={all_zero}")
-        if n_unique == 1:
+        all_zero = bool((evals == 0).all())
+        print(
+            f"[INFO] {path.name}: rows={len(evals)} unique_x={len(evals)} "
+            f"range=[{_format_evals(evals[0])}, {_format_evals(evals[-1])}] all_zero={all_zero}"
+        )
+        if len(evals) == 1:
             print(f"[WARN] {path.name}: NoOfEvals has only one unique value.")
-    return df
 
 
-def trial_columns(df: pd.DataFrame) -> List[str]:
-    return [c for c in df.columns if c != "NoOfEvals"]
+def _parse_and_clean(path: Path) -> Tuple[MethodData, int]:
+    """Parse and clean a CSV, returning the data and the number of rows dropped for non-numeric NoOfEvals."""
+    columns = _read_csv_pyarrow(path)
+    if columns is None:
+        columns = _read_csv_pandas(path)
+    if "NoOfEvals" not in columns:
+        raise ValueError(f"{path} must include a 'NoOfEvals' column. Found columns: {list(columns)}")
+    evals = columns.pop("NoOfEvals")
+    cols = list(columns)
+    trials = np.column_stack(list(columns.values())) if cols else np.empty((len(evals), 0))
+
+    # Drop rows with non-numeric NoOfEvals
+    rows = np.flatnonzero(~np.isnan(evals))
+    n_dropped = len(evals) - len(rows)
+    # Sort and deduplicate, keeping the last row of each NoOfEvals value
+    rows = rows[np.argsort(evals[rows], kind="stable")]
+    if len(rows):
+        sorted_evals = evals[rows]
+        rows = rows[np.concatenate([np.diff(sorted_evals) != 0, [True]])]
+    # Gather the surviving rows once rather than copying the trial matrix after every step
+    evals, trials = evals[rows], trials[rows]
+
+    # Row means and per-trial valid ranges come from a single pass over the trial matrix
+    mean_y, first, last, counts = trial_stats(trials)
+    md = MethodData(
+        evals=evals,
+        trials=trials,
+        trial_names=cols,
+        mean_y=mean_y,
+        first_valid=first,
+        last_valid=last,
+        valid_counts=counts,
+    )
+    return md, n_dropped
+
+
+atexit.register(_read_csv_clean_cached.cache_clear)
 
 
-def per_trial_xy(df: pd.DataFrame, col: str, rebase: bool, use_index: bool) -> Tuple[np.ndarray, np.ndarray]:
-    y = pd.to_numeric(df[col], errors="coerce")
-    mask = y.notna()
-    y = y[mask]
+def per_trial_xy(evals: np.ndarray, y_col: np.ndarray, rebase: bool, use_index: bool) -> Tuple[np.ndarray, np.ndarray]:
+    mask = ~np.isnan(y_col)
+    y = y_col[mask]
     if use_index:
-        x = pd.RangeIndex(start=0, stop=len(y), step=1)
+        x = np.arange(y.size)
     else:
-        x = df.loc[mask, "NoOfEvals"].astype(float).copy()
-        if rebase and len(x) > 0:
-            x = x - float(x.iloc[0])
-    return x.to_numpy(), y.to_numpy()
+        x = evals[mask]
+        if rebase and x.size:
+            x = x - x[0]
+    return x, y
 
 
-def compute_global_limits(datasets, logy: bool, mean_only: bool, rebase_per_trial: bool, x_as_index: bool):
+@dataclass
+class Precomputed:
+    """Numeric arrays and x extent derived once per dataset, shared by limits and plotting."""
+
+    x_array: np.ndarray  # NoOfEvals as float, shape (n_rows,)
+    y_matrix: np.ndarray  # trial values, shape (n_rows, n_trials)
+    mean_y: np.ndarray  # per-row mean across trials, shape (n_rows,)
+    xmin: float = np.inf
+    xmax: float = -np.inf
+
+
+def precompute(md: MethodData, mean_only: bool, x_as_index: bool, rebase_per_trial: bool) -> Precomputed:
     """
-    datasets: list of tuples (label, df)
-    Returns (xmin, xmax, ymin, ymax) across all plotted series.
+    Derive the arrays and x extent (xmin, xmax) of what will be drawn for one dataset.
+    The extent stays at +/-inf when there is nothing valid to draw.
     """
-    xmin, xmax = np.inf, -np.inf
-    ymin, ymax = np.inf, -np.inf
+    X = md.evals
+    Y = md.trials
+    pre = Precomputed(x_array=X, y_matrix=Y, mean_y=md.mean_y)
+    if not md.trial_names or len(X) == 0:
+        return pre
 
-    for label, df in datasets:
-        cols = trial_columns(df)
-        if not cols:
-            continue
-
-        if mean_only:
+    if mean_only:
+        x = np.arange(len(X)) if x_as_index else X
+        pre.xmin = nanmin(x)
+        pre.xmax = nanmax(x)
+    else:
+        counts = md.valid_counts
+        has_data = counts > 0
+        if has_data.any():
+            first = md.first_valid[has_data]
+            last = md.last_valid[has_data]
+            # X is sorted, so each trial's x values lie within [X[first], X[last]]
             if x_as_index:
-                aligned = df[cols].apply(pd.to_numeric, errors="coerce")
-                mean_series = aligned.mean(axis=1, skipna=True)
-                x = np.arange(len(mean_series))
-                y = mean_series.to_numpy()
+                pre.xmin = 0.0
+                pre.xmax = float(counts.max() - 1)
+            elif rebase_per_trial:
+                pre.xmin = 0.0
+                pre.xmax = np.max(X[last] - X[first])
             else:
-                aligned = df[["NoOfEvals"] + cols].copy()
-                aligned[cols] = aligned[cols].apply(pd.to_numeric, errors="coerce")
-                x = aligned["NoOfEvals"].astype(float).to_numpy()
-                y = aligned[cols].mean(axis=1, skipna=True).to_numpy()
-            # update limits
-            if len(x) > 0:
-                xmin = min(xmin, np.nanmin(x))
-                xmax = max(xmax, np.nanmax(x))
-            if len(y) > 0:
-                if logy:
-                    ypos = y[y > 0]
-                    if len(ypos) > 0:
-                        ymin = min(ymin, np.nanmin(ypos))
-                        ymax = max(ymax, np.nanmax(ypos))
-                else:
-                    ymin = min(ymin, np.nanmin(y))
-                    ymax = max(ymax, np.nanmax(y))
-        else:
-            for col in cols:
-                x, y = per_trial_xy(df, col, rebase=rebase_per_trial, use_index=x_as_index)
-                if len(x) > 0:
-                    xmin = min(xmin, np.nanmin(x))
-                    xmax = max(xmax, np.nanmax(x))
-                if len(y) > 0:
-                    if logy:
-                        ypos = y[y > 0]
-                        if len(ypos) > 0:
-                            ymin = min(ymin, np.nanmin(ypos))
-                            ymax = max(ymax, np.nanmax(ypos))
-                    else:
-                        ymin = min(ymin, np.nanmin(y))
-                        ymax = max(ymax, np.nanmax(y))
-
-            # also consider mean if show_mean was desired later (but global scale should reflect only what we draw)
-            # Here mean_only determines we don't include means when not requested.
+                pre.xmin = X[first.min()]
+                pre.xmax = X[last.max()]
+    return pre
+
+
+def compute_global_limits(precomputed: List[Precomputed], logy: bool, mean_only: bool):
+    """
+    precomputed: list of per-dataset Precomputed results
+    Returns (xmin, xmax, ymin, ymax) across all plotted series.
+    """
+    xmin = min((p.xmin for p in precomputed), default=np.inf)
+    xmax = max((p.xmax for p in precomputed), default=-np.inf)
+
+    # Stack every drawn y value (global scale should reflect only what we draw) and reduce once
+    all_y = np.concatenate(
+        [p.mean_y if mean_only else p.y_matrix.ravel() for p in precomputed if p.y_matrix.shape[1] > 0]
+        or [np.empty(0)]
+    )
+    ymin, ymax = np.inf, -np.inf
+    if logy:
+        # Non-positive and NaN values become +/-inf instead of being filtered out into a copy
+        positive = all_y > 0
+        ymin = np.min(np.where(positive, all_y, np.inf), initial=np.inf)
+        ymax = np.max(np.where(positive, all_y, -np.inf), initial=-np.inf)
+    elif all_y.size:
+        with warnings.catch_warnings():
+            # All-NaN input yields NaN, which the fallback below replaces
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            ymin, ymax = nanmin(all_y), nanmax(all_y)
 
     # Fallbacks if nothing valid
     if not np.isfinite(xmin) or not np.isfinite(xmax) or xmin == xmax:
@@ -115,8 +376,31 @@ def compute_global_limits(datasets, logy: bool, mean_only: bool, rebase_per_tria
     return float(xmin), float(xmax), float(ymin), float(ymax)
 
 
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_target: int = 4000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series sorted by x to at most ~n_target points for drawing.
+    x is split into n_target // 2 equal-width buckets and only the min and max y of each bucket
+    (plus both endpoints) are kept, so the visible envelope of the line is unchanged.
+    """
+    n = len(y)
+    if n <= n_target or not x[-1] > x[0]:
+        return x, y
+    edges = np.linspace(x[0], x[-1], n_target // 2 + 1)[1:-1]
+    bucket = np.searchsorted(edges, x, side="right")
+    # Sorting by (bucket, y) puts each bucket's min first; by (bucket, -y) its max first. NaNs sort last.
+    keep = [np.array([0, n - 1])]
+    for key in (y, -y):
+        order = np.lexsort((key, bucket))
+        b = bucket[order]
+        keep.append(order[np.flatnonzero(np.r_[True, b[1:] != b[:-1]])])
+    keep = np.unique(np.concatenate(keep))
+    return x[keep], y[keep]
+
+
 def plot_single_method(
-    df: pd.DataFrame,
+    fig: plt.Figure,
+    ax: plt.Axes,
+    pre: Precomputed,
     label: str,
     xmin: float,
     xmax: float,
@@ -129,61 +413,66 @@ def plot_single_method(
     x_as_index: bool,
     output_path: Path,
 ):
-    plt.figure(figsize=(11, 7))
-    cols = trial_columns(df)
+    # The figure is reused across datasets, so start from a blank axes
+    ax.clear()
 
     if not mean_only:
         # plot each trial
         default_markers = ["o", "s", "^", "D", "v", "x", "P", "*", "h", "<", ">"]
-        for i, col in enumerate(cols):
+        for i in range(pre.y_matrix.shape[1]):
             m = default_markers[i % len(default_markers)]
-            x, y = per_trial_xy(df, col, rebase=rebase_per_trial, use_index=x_as_index)
-            plt.plot(x, y, marker=m, linewidth=1.6, markersize=4.5, alpha=0.6, label=f"Trial {i + 1}")
+            x, y = per_trial_xy(pre.x_array, pre.y_matrix[:, i], rebase=rebase_per_trial, use_index=x_as_index)
+            x, y = minmax_decimate(x, y)
+            ax.plot(x, y, marker=m, linewidth=1.6, markersize=4.5, alpha=0.6, rasterized=True, label=f"Trial {i + 1}")
 
     if show_mean or mean_only:
-        if x_as_index:
-            aligned = df[cols].apply(pd.to_numeric, errors="coerce")
-            mean_series = aligned.mean(axis=1, skipna=True)
-            x_mean = np.arange(len(mean_series))
-            plt.plot(x_mean, mean_series.to_numpy(), linewidth=3.0, alpha=0.98, label="Mean")
-        else:
-            aligned = df[["NoOfEvals"] + cols].copy()
-            aligned[cols] = aligned[cols].apply(pd.to_numeric, errors="coerce")
-            plt.plot(
-                aligned["NoOfEvals"].astype(float).to_numpy(),
-                aligned[cols].mean(axis=1, skipna=True).to_numpy(),
-                linewidth=3.0,
-                alpha=0.98,
-                label="Mean",
-            )
+        x_mean = np.arange(len(pre.mean_y)) if x_as_index else pre.x_array
+        x_mean, y_mean = minmax_decimate(x_mean, pre.mean_y)
+        ax.plot(x_mean, y_mean, linewidth=3.0, alpha=0.98, label="Mean")
 
     if logy:
-        plt.yscale("log")
+        ax.set_yscale("log")
 
     # Axis labels
     if x_as_index:
-        plt.xlabel("Step Index per Trial", fontsize=12)
+        ax.set_xlabel("Step Index per Trial", fontsize=12)
     else:
         xlabel = (
             "Number of Evaluations (per trial rebased)"
             if rebase_per_trial and not mean_only
             else "Number of Evaluations"
         )
-        plt.xlabel(xlabel, fontsize=12)
+        ax.set_xlabel(xlabel, fontsize=12)
 
-    plt.ylabel("Best Value (Log Scale)" if logy else "Best Value", fontsize=12)
-    plt.title(f"{label}", fontsize=14)
-    plt.grid(True, which="both", ls="-", alpha=0.3)
-    plt.xlim(xmin, xmax)
+    ax.set_ylabel("Best Value (Log Scale)" if logy else "Best Value", fontsize=12)
+    ax.set_title(f"{label}", fontsize=14)
+    ax.grid(True, which="both", ls="-", alpha=0.3)
+    ax.set_xlim(xmin, xmax)
     # For log scale, ensure ymin>0
     if logy and ymin <= 0:
         ymin = max(ymin, 1e-12)
-    plt.ylim(ymin, ymax)
-    plt.legend(loc="best")
+    ax.set_ylim(ymin, ymax)
+    ax.legend(loc="best")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(output_path, dpi=300)
+
+
+# Per-process figure reused by every plot a worker renders
+_worker_fig = None
+_worker_ax = None
+
+
+def _init_plot_worker():
+    global _worker_fig, _worker_ax
+    # Match the savefig DPI so rasterized trial layers are not resampled at save time
+    _worker_fig, _worker_ax = plt.subplots(figsize=(11, 7), dpi=300)
+    # Fixed margins for the fixed figure size instead of per-plot tight layout text-extent passes
+    _worker_fig.subplots_adjust(left=0.08, right=0.97, top=0.93, bottom=0.09)
+
+
+def _plot_task(kwargs: dict) -> Path:
+    plot_single_method(fig=_worker_fig, ax=_worker_ax, **kwargs)
+    return kwargs["output_path"]
 
 
 def main():
@@ -206,21 +495,26 @@ def main():
     # Load all
     datasets = [(label, read_csv_clean(f)) for label, f in zip(labels, files)]
 
+    # Derive arrays and per-dataset limits once; plotting reuses them
+    precomputed = [
+        precompute(
+            md,
+            mean_only=args.mean_only,
+            x_as_index=args.x_as_index,
+            rebase_per_trial=args.rebase_per_trial,
+        )
+        for _, md in datasets
+    ]
+
     # Global limits across what we intend to draw
-    xmin, xmax, ymin, ymax = compute_global_limits(
-        datasets,
-        logy=not args.no_logy,
-        mean_only=args.mean_only,
-        rebase_per_trial=args.rebase_per_trial,
-        x_as_index=args.x_as_index,
-    )
+    xmin, xmax, ymin, ymax = compute_global_limits(precomputed, logy=not args.no_logy, mean_only=args.mean_only)
     print(f"[INFO] Global limits -> X:[{xmin}, {xmax}]  Y:[{ymin}, {ymax}]  (logy={not args.no_logy})")
 
     outdir = Path(args.output_dir)
-    for label, df in datasets:
-        outfile = outdir / f"{label.replace(' ', '_')}.png"
-        plot_single_method(
-            df=df,
+    # Only arrays (Precomputed) are shipped to workers, not DataFrames
+    tasks = [
+        dict(
+            pre=pre,
             label=label,
             xmin=xmin,
             xmax=xmax,
@@ -231,9 +525,22 @@ def main():
             show_mean=args.show_mean,
             rebase_per_trial=args.rebase_per_trial,
             x_as_index=args.x_as_index,
-            output_path=outfile,
+            output_path=outdir / f"{label.replace(' ', '_')}.png",
         )
-        print(f"[OK] Wrote {outfile}")
+        for (label, _), pre in zip(datasets, precomputed)
+    ]
+
+    # Each figure is independent, so render them in parallel when there is more than one
+    n_workers = min(os.cpu_count() or 1, len(tasks))
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_plot_worker) as executor:
+            for outfile in executor.map(_plot_task, tasks):
+                print(f"[OK] Wrote {outfile}")
+    else:
+        _init_plot_worker()
+        for outfile in map(_plot_task, tasks):
+            print(f"[OK] Wrote {outfile}")
+        plt.close(_worker_fig)
 
 
 if __name__ == "__main__":
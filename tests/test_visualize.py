@@ -0,0 +1,164 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "plot"))
+import visualize  # noqa: E402
+
+
+CSV = "NoOfEvals,t0,t1\n0,5.0,4.0\n50,3.0,\n100,1.0,2.0\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "ms.csv"
+    path.write_text(CSV)
+    visualize._read_csv_clean_cached.cache_clear()
+    yield path
+    visualize._read_csv_clean_cached.cache_clear()
+
+
+def cache_of(path: Path) -> Path:
+    return path.with_name(path.name + ".clean.npz")
+
+
+@pytest.mark.parametrize("size", [100, 0])
+def test_truncated_cache_is_rebuilt(csv_path, size):
+    expected = visualize.read_csv_clean(csv_path)
+    cache = cache_of(csv_path)
+    with open(cache, "r+b") as f:
+        f.truncate(size)
+    visualize._read_csv_clean_cached.cache_clear()
+
+    md = visualize.read_csv_clean(csv_path)
+
+    np.testing.assert_array_equal(md.evals, expected.evals)
+    np.testing.assert_array_equal(md.trials, expected.trials)
+    assert md.trial_names == expected.trial_names
+    # The broken cache was replaced by a readable one
+    st = csv_path.stat()
+    assert visualize._load_clean_npz(cache, st.st_mtime_ns, st.st_size) is not None
+
+
+def test_cache_write_leaves_no_temporary_files(csv_path):
+    visualize.read_csv_clean(csv_path)
+
+    assert sorted(p.name for p in csv_path.parent.iterdir()) == sorted([csv_path.name, cache_of(csv_path).name])
+
+
+def test_replaced_csv_with_preserved_mtime_is_reparsed(csv_path):
+    old = csv_path.stat()
+    visualize.read_csv_clean(csv_path)
+    # What cp -p / rsync -a / tar do: new contents, original mtime
+    csv_path.write_text("NoOfEvals,t0,t1\n0,9.0,8.0\n")
+    os.utime(csv_path, ns=(old.st_atime_ns, old.st_mtime_ns))
+    visualize._read_csv_clean_cached.cache_clear()
+
+    md = visualize.read_csv_clean(csv_path)
+
+    np.testing.assert_array_equal(md.evals, [0.0])
+    np.testing.assert_array_equal(md.trials, [[9.0, 8.0]])
+
+
+def test_cached_load_repeats_diagnostics(tmp_path, capsys):
+    path = tmp_path / "w.csv"
+    path.write_text("NoOfEvals,t0\nx,1.0\n10,2.0\n")
+    visualize._read_csv_clean_cached.cache_clear()
+    visualize.read_csv_clean(path)
+    first = capsys.readouterr().out
+    visualize._read_csv_clean_cached.cache_clear()
+
+    visualize.read_csv_clean(path)
+
+    assert "Dropped 1 rows" in first and "only one unique value" in first
+    assert capsys.readouterr().out == first
+
+
+def test_cache_name_keeps_input_suffix(tmp_path):
+    csv_path = tmp_path / "x.csv"
+    txt_path = tmp_path / "x.txt"
+    csv_path.write_text("NoOfEvals,t0\n0,1.0\n")
+    txt_path.write_text("NoOfEvals,t0\n0,1.0\n5,2.0\n")
+    visualize._read_csv_clean_cached.cache_clear()
+
+    assert len(visualize.read_csv_clean(csv_path).evals) == 1
+    assert len(visualize.read_csv_clean(txt_path).evals) == 2
+    assert cache_of(csv_path).exists() and cache_of(txt_path).exists()
+
+
+def test_duplicate_header_falls_back_to_pandas(tmp_path):
+    path = tmp_path / "dup_header.csv"
+    path.write_text("NoOfEvals,a,a\n0,1.0,2.0\n10,3.0,4.0\n")
+    visualize._read_csv_clean_cached.cache_clear()
+
+    md = visualize.read_csv_clean(path)
+
+    assert md.trial_names == ["a", "a.1"]
+    np.testing.assert_array_equal(md.trials, [[1.0, 2.0], [3.0, 4.0]])
+
+
+def test_diagnostics_print_integral_evals_as_integers(tmp_path, capsys):
+    path = tmp_path / "r.csv"
+    path.write_text("NoOfEvals,t0\n0,1.0\n1000000,2.0\n")
+    visualize._read_csv_clean_cached.cache_clear()
+
+    visualize.read_csv_clean(path)
+
+    assert "range=[0, 1000000]" in capsys.readouterr().out
+
+
+def decimate_input():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.sin(x / 300.0) + rng.random(x.size)
+    y[1234] = 5.0
+    y[8765] = -5.0
+    return x, y
+
+
+def test_minmax_decimate_keeps_extremes_and_order():
+    x, y = decimate_input()
+
+    xd, yd = visualize.minmax_decimate(x, y, n_target=400)
+
+    assert len(xd) <= 400 + 2
+    assert np.all(np.diff(xd) > 0)
+    assert yd.max() == 5.0 and yd.min() == -5.0
+    assert xd[0] == x[0] and xd[-1] == x[-1]
+
+
+def test_minmax_decimate_short_series_is_unchanged():
+    x, y = decimate_input()
+
+    xd, yd = visualize.minmax_decimate(x[:100], y[:100], n_target=400)
+
+    np.testing.assert_array_equal(xd, x[:100])
+    np.testing.assert_array_equal(yd, y[:100])
+
+
+def test_minmax_decimate_keeps_gap_for_all_nan_bucket():
+    x, y = decimate_input()
+    # 200 buckets of ~50 points each; blank out several whole buckets
+    y[5000:5200] = np.nan
+
+    xd, yd = visualize.minmax_decimate(x, y, n_target=400)
+
+    gap = (xd >= 5000) & (xd < 5200)
+    assert gap.any() and np.isnan(yd[gap]).all()
+    # Valid points on both sides remain, so the plotted line breaks at the NaNs instead of bridging them
+    assert not np.isnan(yd[xd < 5000]).any() and not np.isnan(yd[xd >= 5200]).any()
+
+
+def test_repeated_evals_keep_last_row(tmp_path, capsys):
+    path = tmp_path / "repeat.csv"
+    path.write_text("NoOfEvals,t0\n5,1.0\n0,2.0\n5,3.0\n,9.0\n0,4.0\n")
+    visualize._read_csv_clean_cached.cache_clear()
+
+    md = visualize.read_csv_clean(path)
+
+    np.testing.assert_array_equal(md.evals, [0.0, 5.0])
+    np.testing.assert_array_equal(md.trials, [[4.0], [3.0]])
+    assert "Dropped 1 rows" in capsys.readouterr().out